@@ -0,0 +1,116 @@
+import asyncio
+from typing import Dict, List, Mapping, Optional, Set, Union
+
+import aioboto3
+
+from python_aws_ssm.parameters import (
+    GET_PARAMETERS_BATCH_SIZE,
+    InvalidParametersError,
+    MissingParameterError,
+    ParameterStore,
+)
+
+
+class AsyncParameterStore:
+    """
+    Asynchronous counterpart of ParameterStore, backed by aioboto3.
+
+    Many concurrent fetches share one event loop and connection pool and
+    interleave while waiting on SSM round-trips, instead of blocking a
+    thread per request. Requires the `async` extra (aioboto3).
+    """
+
+    def __init__(self, session: Optional["aioboto3.Session"] = None):
+        """
+        :param: session: an optional pre-configured aioboto3 Session.
+        """
+        self._session = session or aioboto3.Session()
+
+    async def get_parameters(
+        self, ssm_key_names: List[str], with_decryption: bool = True
+    ) -> Dict[str, Optional[str]]:
+        """
+        Retrieve keys from SSM, mirroring ParameterStore.get_parameters:
+        missing keys map to None, unrequested extras are dropped and the
+        10-name batches are requested concurrently on the event loop.
+
+        :raises: InvalidParametersError when invalid parameters were requested.
+        """
+        if not ssm_key_names:
+            return {}
+
+        chunks = [
+            ssm_key_names[i : i + GET_PARAMETERS_BATCH_SIZE]
+            for i in range(0, len(ssm_key_names), GET_PARAMETERS_BATCH_SIZE)
+        ]
+        async with self._session.client("ssm") as client:
+            responses = await asyncio.gather(
+                *(
+                    client.get_parameters(Names=chunk, WithDecryption=with_decryption)
+                    for chunk in chunks
+                )
+            )
+
+        invalid_parameters = [
+            parameter_name
+            for response in responses
+            for parameter_name in response.get("InvalidParameters", [])
+        ]
+        if invalid_parameters:
+            raise InvalidParametersError(invalid_parameters)
+
+        retrieved_values: Dict[str, Optional[str]] = {
+            parameter["Name"]: parameter.get("Value")
+            for response in responses
+            for parameter in response.get("Parameters", [])
+        }
+        return {name: retrieved_values.get(name) for name in ssm_key_names}
+
+    async def get_parameters_by_path(
+        self,
+        ssm_base_path: str,
+        with_decryption: bool = True,
+        recursive: bool = False,
+        nested: bool = False,
+        required_parameters: Optional[Set[str]] = None,
+    ) -> Mapping[str, Union[Dict, Optional[str]]]:
+        """
+        Retrieve all the keys under a certain path on SSM, mirroring
+        ParameterStore.get_parameters_by_path (same stripping, nesting
+        and required-parameter semantics), while consuming the paginator
+        asynchronously.
+
+        :raises: MissingParameterError when required parameters are absent.
+        """
+        prefix = ssm_base_path if ssm_base_path.endswith("/") else ssm_base_path + "/"
+        prefix_length = len(prefix)
+
+        missing_parameters = set(required_parameters or ())
+        parameters: Dict[str, Optional[str]] = {}
+        async with self._session.client("ssm") as client:
+            pages = client.get_paginator("get_parameters_by_path").paginate(
+                Path=ssm_base_path,
+                Recursive=recursive,
+                WithDecryption=with_decryption,
+                PaginationConfig={"PageSize": 10},
+            )
+            async for page in pages:
+                for parameter in page.get("Parameters", []):
+                    name = parameter["Name"]
+                    name = (
+                        name[prefix_length:]
+                        if name.startswith(prefix)
+                        else name.lstrip("/")
+                    )
+                    parameters[name] = parameter.get("Value")
+                    if missing_parameters:
+                        missing_parameters.discard(name)
+
+        if missing_parameters:
+            raise MissingParameterError(list(missing_parameters), ssm_base_path)
+
+        return (
+            ParameterStore._parse_parameters(parameters)
+            if recursive and nested
+            else parameters
+        )
@@ -0,0 +1,194 @@
+import copy
+import mmap
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import click
+from yaml import load as yaml_load
+
+try:
+    # orjson serialises in C and is several times faster than the stdlib
+    # json module; fall back when it is not installed.
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_sorted(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+
+    _loads = orjson.loads
+
+except ImportError:  # pragma: no cover - depends on the local environment.
+    import json
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def _dumps_sorted(obj: Any) -> str:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+    def _loads(data: Any) -> Any:
+        return json.loads(data)
+
+
+try:
+    # The libyaml-backed loader parses in C and is an order of magnitude
+    # faster than the pure-Python SafeLoader; fall back when libyaml is
+    # not available.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the local libyaml build.
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+from python_aws_ssm.parameters import ParameterStore
+
+
+@lru_cache(maxsize=1)
+def _store() -> ParameterStore:
+    # Constructing the boto3 SSM client loads the full service model and
+    # is by far the slowest part of CLI start-up; build it once, on first
+    # use, so e.g. --help never pays for it.
+    return ParameterStore()
+
+
+# Parsed YAML files keyed by resolved path; entries are invalidated when
+# the file's mtime or size changes and evicted least-recently-used.
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+_YAML_CACHE_MAX_SIZE = 100
+
+
+def _load_yaml_file(file: str) -> Any:
+    """
+    Parse a YAML file, reusing a previously parsed result when the file
+    has not changed since. A deep copy is returned on cache hits so that
+    callers are free to mutate the result.
+    """
+    stat = os.stat(file)
+    key = str(Path(file).resolve())
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    # The YAML loader accepts bytes directly, so skip the str decode.
+    parsed = yaml_load(Path(file).read_bytes(), Loader=_YamlLoader)
+    _YAML_CACHE[key] = (stat.st_mtime, stat.st_size, parsed)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(parsed)
+
+
+def _read_file_value(file: str) -> str:
+    """
+    Read a file's contents as UTF-8 for raw passthrough to PutParameter.
+
+    The file is memory-mapped and decoded straight from the mapping, so
+    the contents are copied into userland exactly once (as the decoded
+    str) instead of first into an intermediate bytes object as well.
+    """
+    with open(file, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            # Zero-length mappings are rejected by mmap.
+            return ""
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(memoryview(mapped), "utf-8")
+
+
+@click.group(
+    context_settings={"max_content_width": 100, "help_option_names": ["-h", "--help"]},
+    no_args_is_help=True,
+)
+def cli() -> None:
+    """Interact with the AWS SSM Parameter Store."""
+
+
+@cli.command()
+@click.option(
+    "--key",
+    "keys",
+    multiple=True,
+    required=True,
+    help="Name of the parameter to fetch. May be passed multiple times.",
+)
+def get(keys: Tuple[str, ...]) -> None:
+    """Fetch one or more parameters by name and print them as JSON."""
+    parameter_store = _store()
+    parameters: Dict[str, Optional[str]]
+    if len(keys) == 1:
+        # GetParameter has a much higher throttling bucket than
+        # GetParameters, so single lookups go through it directly.
+        parameters = {keys[0]: parameter_store.get_parameter(keys[0])}
+    else:
+        parameters = dict(parameter_store.get_parameters(list(keys)))
+    click.echo(_dumps(parameters))
+
+
+@cli.command()
+@click.option("--key", required=True, help="Name of the parameter to store.")
+@click.option("--value", default=None, help="Literal value to store.")
+@click.option(
+    "--file",
+    "file",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="File whose contents are stored as the parameter value.",
+)
+@click.option(
+    "--yaml-node",
+    default=None,
+    help="Store only this top-level node of the YAML file given via --file.",
+)
+@click.option(
+    "--to-json",
+    is_flag=True,
+    default=False,
+    help="Serialise the (YAML) value to JSON before storing it.",
+)
+def put(
+    key: str,
+    value: Optional[str],
+    file: Optional[str],
+    yaml_node: Optional[str],
+    to_json: bool,
+) -> None:
+    """Store a parameter from a literal value or a (YAML) file."""
+    if (value is None) == (file is None):
+        raise click.UsageError("Provide exactly one of --value or --file.")
+
+    if file is not None and (yaml_node or to_json):
+        if yaml_node:
+            yaml_data = _load_yaml_file(file)
+            yaml_data = yaml_data[yaml_node]
+        else:
+            # JSON is a YAML subset and parses an order of magnitude
+            # faster through the JSON parser, so try that first. Both
+            # parsers accept bytes, so no intermediate str is built.
+            data = Path(file).read_bytes()
+            try:
+                yaml_data = _loads(data)
+            except ValueError:
+                yaml_data = yaml_load(data, Loader=_YamlLoader)
+        # Serialise only when needed: a node that is already a string
+        # is stored as-is unless JSON output was asked for explicitly,
+        # while non-string nodes always need serialising to be stored.
+        # Keys are sorted so the stored value is stable across runs
+        # regardless of the order the source file lists them in.
+        if to_json or not isinstance(yaml_data, str):
+            final_value = _dumps_sorted(yaml_data)
+        else:
+            final_value = yaml_data
+    elif file is not None:
+        final_value = _read_file_value(file)
+    else:
+        # The guard above ensures --value was given when --file was not.
+        assert value is not None
+        final_value = value
+
+    parameter_store = _store()
+    parameter_store.client.put_parameter(
+        Name=key, Value=final_value, Type="String", Overwrite=True
+    )
+    click.echo(f"Parameter {key} stored.")
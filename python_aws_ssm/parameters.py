@@ -1,6 +1,91 @@
-from typing import Any, Dict, List, Optional, Set, Union
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import boto3
+if TYPE_CHECKING:
+    import boto3
+
+# SSM rejects GetParameters calls with more than 10 names.
+GET_PARAMETERS_BATCH_SIZE = 10
+
+_DEFAULT_CLIENT: Optional["boto3.client"] = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_default_ssm_client() -> "boto3.client":
+    """
+    Return the process-wide shared SSM client.
+
+    Every ParameterStore constructed without an explicit client reuses
+    this one, so the TCP+TLS handshake and service model loading happen
+    once per process instead of once per instance, and concurrent use
+    does not exhaust a per-instance connection pool.
+    """
+    global _DEFAULT_CLIENT
+    if _DEFAULT_CLIENT is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                # boto3 (and the service model loading it triggers) is
+                # only imported once a client is actually needed, keeping
+                # `import python_aws_ssm` cheap.
+                import boto3
+                from botocore.config import Config
+
+                # Client-side parameter validation is pure Python overhead
+                # on every call; the larger connection pool lets batched
+                # GetParameters calls actually run concurrently.
+                _DEFAULT_CLIENT = boto3.client(
+                    "ssm",
+                    config=Config(
+                        parameter_validation=False,
+                        retries={"mode": "standard", "total_max_attempts": 5},
+                        tcp_keepalive=True,
+                        max_pool_connections=50,
+                    ),
+                )
+    return _DEFAULT_CLIENT
+
+
+@lru_cache(maxsize=4096)
+def _split_key(key: str) -> Tuple[str, ...]:
+    # SSM hierarchies repeat the same path segments across thousands of
+    # keys; interning them lets repeated dict lookups hit CPython's
+    # identity fast path and reuse the same string objects.
+    return tuple(sys.intern(part) for part in key.split("/"))
+
+
+def _prefetched(pages: Iterable[Dict]) -> Iterator[Dict]:
+    """
+    Iterate over pages while already fetching the next page on a worker
+    thread, so the network wait for page N+1 overlaps with processing of
+    page N.
+    """
+    iterator = iter(pages)
+    sentinel: Any = object()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, iterator, sentinel)
+        while True:
+            page = future.result()
+            if page is sentinel:
+                return
+            future = executor.submit(next, iterator, sentinel)
+            yield page
 
 
 class MissingParameterError(Exception):
@@ -12,10 +97,21 @@ class MissingParameterError(Exception):
         self, parameter_names: List[str], parameter_path: str, *args: object
     ) -> None:
         super().__init__(*args)
-        self.msg: str = f"Missing parameters {parameter_names} on path {parameter_path}"
         self.parameter_names: List[str] = parameter_names
         self.parameter_path: str = parameter_path
 
+    def __str__(self) -> str:
+        # The message is only formatted when the exception is actually
+        # rendered, so raising and handling it stays allocation-free.
+        return (
+            f"Missing parameters [{', '.join(sorted(self.parameter_names))}]"
+            f" on path {self.parameter_path}"
+        )
+
+    @property
+    def msg(self) -> str:
+        return str(self)
+
 
 class InvalidParametersError(Exception):
     """
@@ -28,10 +124,64 @@ class InvalidParametersError(Exception):
 
 
 class ParameterStore:
-    def __init__(self, client: Optional[boto3.client] = None):
-        self.client = client or boto3.client("ssm")
+    def __init__(
+        self,
+        client: Optional["boto3.client"] = None,
+        ssm_cache_ttl: float = 30.0,
+    ):
+        """
+        :param: client: an optional pre-configured boto3 SSM client. When
+        omitted, the shared client from get_default_ssm_client() is used.
+        :param: ssm_cache_ttl: how long, in seconds, results are served
+        from an in-process cache before SSM is called again. Pass 0 to
+        disable caching.
+        """
+        self.client = client or get_default_ssm_client()
+        self.ssm_cache_ttl = ssm_cache_ttl
+        # Results keyed by request, each entry a (timestamp, result) pair.
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+    def _cached(self, cache_key: Tuple, fetch: Any) -> Any:
+        """
+        Serve `fetch()` results from the in-process cache while they are
+        younger than the TTL, so repeated identical requests skip the SSM
+        round-trip entirely.
+        """
+        if not self.ssm_cache_ttl:
+            return fetch()
+        now = time.monotonic()
+        entry = self._cache.get(cache_key)
+        if entry is not None and now - entry[0] < self.ssm_cache_ttl:
+            # Results are read-only views, so hits are handed out as-is
+            # instead of deep-copying the cached result.
+            return entry[1]
+        result = fetch()
+        self._cache[cache_key] = (now, result)
+        return result
+
+    def get_parameter(self, ssm_key_name: str, with_decryption: bool = True) -> str:
+        """
+        Retrieve a single key from SSM via the GetParameter API call.
+
+        Single lookups should prefer this over get_parameters: GetParameter
+        is throttled against a far higher request-per-second bucket than
+        GetParameters, so it sustains more lookups under rate limiting.
 
-    def get_parameters(self, ssm_key_names: List[str]) -> Dict[str, Optional[str]]:
+        Results are cached in-process for `ssm_cache_ttl` seconds.
+
+        :raises: botocore ParameterNotFound when the key does not exist.
+        """
+        cache_key = ("get_parameter", ssm_key_name, with_decryption)
+        return self._cached(
+            cache_key,
+            lambda: self.client.get_parameter(
+                Name=ssm_key_name, WithDecryption=with_decryption
+            )["Parameter"]["Value"],
+        )
+
+    def get_parameters(
+        self, ssm_key_names: List[str], with_decryption: bool = True
+    ) -> Mapping[str, Optional[str]]:
         """
         Retrieve keys from SSM.
         The keys are mapped to a dictionary for easy querying:
@@ -42,28 +192,70 @@ class ParameterStore:
         If SSM somehow returns keys that are not requested, these keys are not
         returned in the result dict.
 
+        Results are cached in-process for `ssm_cache_ttl` seconds and are
+        returned as read-only mappings; mutating one raises a TypeError.
+
+        :param: with_decryption: decrypt SecureString values via KMS. Pass
+        False on plaintext-only key sets to skip the KMS round-trips.
+
         :raises: InvalidParametersError when invalid parameters were requested.
         """
 
-        response: Dict = self.client.get_parameters(
-            Names=ssm_key_names, WithDecryption=True
-        )
-        if response.get("InvalidParameters"):
-            raise InvalidParametersError(response["InvalidParameters"])
+        if not ssm_key_names:
+            return MappingProxyType({})
 
-        retrieved_parameters: List[Dict] = response.get("Parameters", [])
+        cache_key = ("get_parameters", tuple(sorted(ssm_key_names)), with_decryption)
+        return self._cached(
+            cache_key,
+            lambda: self._fetch_parameters(ssm_key_names, with_decryption),
+        )
 
-        # Initialise the result so that missing keys have a None value.
-        filled_parameters: Dict[str, Optional[str]] = {
-            parameter_name: None for parameter_name in ssm_key_names
-        }
+    def _fetch_parameters(
+        self, ssm_key_names: List[str], with_decryption: bool = True
+    ) -> Mapping[str, Optional[str]]:
+        # SSM caps GetParameters at 10 names per call; request the keys in
+        # batches and issue the batches concurrently, as the work is purely
+        # network-bound.
+        chunks = [
+            ssm_key_names[i : i + GET_PARAMETERS_BATCH_SIZE]
+            for i in range(0, len(ssm_key_names), GET_PARAMETERS_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            responses: List[Dict] = [
+                self.client.get_parameters(
+                    Names=chunks[0], WithDecryption=with_decryption
+                )
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                responses = list(
+                    executor.map(
+                        lambda chunk: self.client.get_parameters(
+                            Names=chunk, WithDecryption=with_decryption
+                        ),
+                        chunks,
+                    )
+                )
 
-        # Merge the retrieved parameters in.
-        for retrieved in retrieved_parameters:
-            if retrieved.get("Name") in ssm_key_names:
-                filled_parameters[retrieved["Name"]] = retrieved.get("Value")
+        invalid_parameters = [
+            parameter_name
+            for response in responses
+            for parameter_name in response.get("InvalidParameters", [])
+        ]
+        if invalid_parameters:
+            raise InvalidParametersError(invalid_parameters)
 
-        return filled_parameters
+        # Index the retrieved parameters by name, then build the result in
+        # request order: missing keys map to None and keys SSM returned
+        # but that were never requested are dropped.
+        retrieved_values: Dict[str, Optional[str]] = {
+            parameter["Name"]: parameter.get("Value")
+            for response in responses
+            for parameter in response.get("Parameters", [])
+        }
+        return MappingProxyType(
+            {name: retrieved_values.get(name) for name in ssm_key_names}
+        )
 
     def get_parameters_by_path(
         self,
@@ -72,7 +264,8 @@ class ParameterStore:
         recursive: bool = False,
         nested: bool = False,
         required_parameters: Optional[Set[str]] = None,
-    ) -> Dict[str, Union[Dict, Optional[str]]]:
+        only_required: bool = False,
+    ) -> Mapping[str, Union[Dict, Optional[str]]]:
         """
         Retrieve all the keys under a certain path on SSM.
         * When recursive is set to False, SSM doesn't return keys under a nested path.
@@ -87,82 +280,116 @@ class ParameterStore:
         Note: we assert the parameters before transforming the parameters to a nested
         structure. Provide paths in path format, e.g. "foo/bar" for "/path/sub/foo/bar",
         to prevent your required path from being listed as missing.
+        :param: only_required: when set (and required_parameters is given),
+        stop paginating as soon as all required parameters have been seen.
+        The result is then bounded by the required set rather than the
+        size of the hierarchy, but may not contain every key on the path.
         :return If nested=False, a dictionary of string to optional string value.
          If nested=True, a dictionary of string to potentially nested dictionaries with
          optional string values.
+
+        Results are cached in-process for `ssm_cache_ttl` seconds and are
+        returned as read-only mappings; mutating one raises a TypeError.
         """
 
-        parameters = self.client.get_parameters_by_path(
-            Path=ssm_base_path, Recursive=recursive, WithDecryption=with_decryption
-        ).get("Parameters")
+        cache_key = (
+            "get_parameters_by_path",
+            ssm_base_path,
+            with_decryption,
+            recursive,
+            nested,
+            frozenset(required_parameters) if required_parameters else None,
+            only_required,
+        )
+        return self._cached(
+            cache_key,
+            lambda: self._fetch_parameters_by_path(
+                ssm_base_path,
+                with_decryption,
+                recursive,
+                nested,
+                required_parameters,
+                only_required,
+            ),
+        )
+
+    def _fetch_parameters_by_path(
+        self,
+        ssm_base_path: str,
+        with_decryption: bool,
+        recursive: bool,
+        nested: bool,
+        required_parameters: Optional[Set[str]],
+        only_required: bool = False,
+    ) -> Mapping[str, Union[Dict, Optional[str]]]:
+        # Page through the full result set: a single call only returns the
+        # first page (at most 10 parameters) and a NextToken.
+        pages = self.client.get_paginator("get_parameters_by_path").paginate(
+            Path=ssm_base_path,
+            Recursive=recursive,
+            WithDecryption=with_decryption,
+            PaginationConfig={"PageSize": 10},
+        )
 
-        parameters = {
-            parameter.get("Name").replace(ssm_base_path, ""): parameter.get("Value")
-            for parameter in parameters
-        }
+        # Normalise the prefix once so parameter names are stripped
+        # identically whether or not the base path has a trailing slash,
+        # with a single slice per parameter instead of per-name scans.
+        prefix = ssm_base_path if ssm_base_path.endswith("/") else ssm_base_path + "/"
+        prefix_length = len(prefix)
 
-        if required_parameters:
-            self._assert_required(required_parameters, parameters, ssm_base_path)
+        # Accumulate the parameters and tick off the required ones in the
+        # same pass over the streamed pages, instead of re-scanning the
+        # assembled dict afterwards.
+        missing_parameters = set(required_parameters or ())
+        parameters: Dict[str, Optional[str]] = {}
+        for page in _prefetched(pages):
+            for parameter in page.get("Parameters", []):
+                name = parameter["Name"]
+                name = (
+                    name[prefix_length:]
+                    if name.startswith(prefix)
+                    else name.lstrip("/")
+                )
+                parameters[name] = parameter.get("Value")
+                if missing_parameters:
+                    missing_parameters.discard(name)
+            # Once every required parameter has been seen there is no need
+            # to pull the rest of the hierarchy for an only_required call.
+            if only_required and required_parameters and not missing_parameters:
+                break
 
-        return (
-            # Non-nested is the default behaviour (hence `else parameters`).
-            self._parse_parameters(parameters)
-            if recursive and nested
-            else self._strip_leading_slashes(parameters)
+        if missing_parameters:
+            raise MissingParameterError(list(missing_parameters), ssm_base_path)
+
+        # Non-nested is the default behaviour; the keys are already
+        # stripped of the prefix and any leading slashes.
+        return MappingProxyType(
+            self._parse_parameters(parameters) if recursive and nested else parameters
         )
 
     @staticmethod
     def _parse_parameters(
         parameters: Dict[str, Optional[str]]
     ) -> Dict[str, Union[Dict, Optional[str]]]:
+        # Insert every parameter into a single nested dict in one pass,
+        # walking (and creating) the intermediate levels in place rather
+        # than building and merging a full nested dict per parameter.
         parsed_dict: Dict[str, Union[Dict, Optional[str]]] = {}
         for key, value in parameters.items():
-            nested_dict = ParameterStore._tree_dict(key.split("/"), value)
-            parsed_dict = ParameterStore._deep_merge(parsed_dict, nested_dict)
+            # Flat keys are the common case and need no nesting at all.
+            if "/" not in key:
+                parsed_dict[key] = value
+                continue
+            parts = _split_key(key)
+            node = parsed_dict
+            for part in parts[:-1]:
+                next_node = node.get(part)
+                # A name can hold both a value and a subtree on SSM; the
+                # subtree replaces the value, matching the old merge
+                # behaviour.
+                if not isinstance(next_node, dict):
+                    next_node = {}
+                    node[part] = next_node
+                node = next_node
+            node[parts[-1]] = value
         return parsed_dict
-
-    @staticmethod
-    def _strip_leading_slashes(
-        parameters: Dict[str, Optional[str]]
-    ) -> Dict[str, Union[Dict, Optional[str]]]:
-        return {
-            parameter_key.lstrip("/"): parameter_value
-            for parameter_key, parameter_value in parameters.items()
-        }
-
-    @staticmethod
-    def _tree_dict(key_list: List[Any], value: Optional[Any]) -> Dict[Any, Any]:
-        """
-        Build a nested dictionary path from a list of keys and a value.
-        For example:
-            _tree_dict(["foo", "bar", "koo"], 42) ==> {"foo": {"bar": {"koo": 42}}}
-        """
-        tree_dict: Dict[Any, Any] = {key_list[-1]: value}
-        for key in reversed(key_list[:-1]):
-            tree_dict = {key: tree_dict}
-        return tree_dict
-
-    @staticmethod
-    def _deep_merge(a: Union[Dict, Any], b: Union[Dict, Any]) -> Union[Dict, Any]:
-        # NOTE: Thanks to: https://stackoverflow.com/a/56177639/9563578
-        if not isinstance(a, dict) or not isinstance(b, dict):
-            return a if b is None else b
-        else:
-            keys = set(a.keys()) | set(b.keys())
-            return {
-                key: ParameterStore._deep_merge(a.get(key), b.get(key)) for key in keys
-            }
-
-    @staticmethod
-    def _assert_required(
-        required_parameters: Set[str],
-        actual_parameters: Dict[str, Any],
-        parameter_path: str,
-    ) -> None:
-        missing_parameters: List[str] = [
-            parameter_name
-            for parameter_name in required_parameters
-            if parameter_name not in actual_parameters
-        ]
-        if missing_parameters:
-            raise MissingParameterError(missing_parameters, parameter_path)
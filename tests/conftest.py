@@ -0,0 +1,12 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from python_aws_ssm.parameters import ParameterStore
+
+
+@pytest.fixture
+def parameter_store() -> ParameterStore:
+    # A fresh instance per test keeps the mocked client's call history
+    # and the instance's TTL cache isolated between tests.
+    return ParameterStore(client=MagicMock())
@@ -0,0 +1,108 @@
+import asyncio
+from typing import Any, Dict, List
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("aioboto3")
+
+from python_aws_ssm.async_parameters import AsyncParameterStore
+
+
+class _AsyncPages:
+    """A minimal async iterator over a list of pre-baked pages."""
+
+    def __init__(self, pages: List[Dict]) -> None:
+        self._pages = iter(pages)
+
+    def __aiter__(self) -> "_AsyncPages":
+        return self
+
+    async def __anext__(self) -> Dict:
+        try:
+            return next(self._pages)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+def _mock_session() -> Any:
+    """Build a session whose `async with session.client("ssm")` yields a mock."""
+    session = MagicMock()
+    client = session.client.return_value.__aenter__.return_value
+    return session, client
+
+
+class TestAsyncParameterStore(TestCase):
+    def test_get_parameters_keys_are_mapped(self) -> None:
+        session, client = _mock_session()
+        client.get_parameters = AsyncMock(
+            return_value={
+                "Parameters": [{"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}]
+            }
+        )
+        parameter_store = AsyncParameterStore(session=session)
+
+        secrets = asyncio.run(
+            parameter_store.get_parameters(["foo_ssm_key_1", "foo_ssm_key_2"])
+        )
+
+        self.assertEqual(
+            {"foo_ssm_key_1": "foo_ssm_value_1", "foo_ssm_key_2": None}, secrets
+        )
+        client.get_parameters.assert_called_once_with(
+            Names=["foo_ssm_key_1", "foo_ssm_key_2"], WithDecryption=True
+        )
+
+    def test_get_parameters_batches_requests_in_chunks_of_ten(self) -> None:
+        session, client = _mock_session()
+        ssm_key_names = [f"foo_ssm_key_{index}" for index in range(25)]
+        client.get_parameters = AsyncMock(
+            side_effect=lambda **kwargs: {
+                "Parameters": [
+                    {"Name": name, "Value": f"value_{name}"} for name in kwargs["Names"]
+                ]
+            }
+        )
+        parameter_store = AsyncParameterStore(session=session)
+
+        secrets = asyncio.run(parameter_store.get_parameters(ssm_key_names))
+
+        self.assertEqual({name: f"value_{name}" for name in ssm_key_names}, secrets)
+        self.assertEqual(3, client.get_parameters.call_count)
+
+    def test_get_parameters_by_path_recursive_nested(self) -> None:
+        session, client = _mock_session()
+        # get_paginator is synchronous even on the async client.
+        client.get_paginator = MagicMock()
+        client.get_paginator.return_value.paginate.return_value = _AsyncPages(
+            [
+                {
+                    "Parameters": [
+                        {"Name": "/bar/env/foo_ssm_key_1", "Value": "foo_ssm_value_1"},
+                        {"Name": "/bar/env/foo_ssm_key_2", "Value": "foo_ssm_value_2"},
+                    ]
+                }
+            ]
+        )
+        parameter_store = AsyncParameterStore(session=session)
+
+        secrets = asyncio.run(
+            parameter_store.get_parameters_by_path("/bar/", recursive=True, nested=True)
+        )
+
+        self.assertEqual(
+            {
+                "env": {
+                    "foo_ssm_key_1": "foo_ssm_value_1",
+                    "foo_ssm_key_2": "foo_ssm_value_2",
+                }
+            },
+            secrets,
+        )
+        client.get_paginator.return_value.paginate.assert_called_once_with(
+            Path="/bar/",
+            Recursive=True,
+            WithDecryption=True,
+            PaginationConfig={"PageSize": 10},
+        )
@@ -0,0 +1,240 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+import python_aws_ssm.cli
+from python_aws_ssm.cli import cli
+
+FIXTURE_FILE = str(Path(__file__).parent / "fixtures" / "sample.yaml")
+
+
+@patch.dict(
+    os.environ,
+    {
+        "AWS_ACCESS_KEY_ID": "testingtestingtesting",
+        "AWS_SECRET_ACCESS_KEY": "testingtestingtesting",
+        "AWS_SESSION_TOKEN": "testingtestingtesting",
+        "AWS_DEFAULT_REGION": "eu-west-1",
+    },
+)
+class TestCli(TestCase):
+    def setUp(self) -> None:
+        # One runner for all tests; the env keeps click from probing
+        # terminal capabilities or emitting ANSI colour codes.
+        self.runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb"})
+
+        self.parameter_store = MagicMock()
+        patcher = patch(
+            "python_aws_ssm.cli.ParameterStore", return_value=self.parameter_store
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        python_aws_ssm.cli._YAML_CACHE.clear()
+        python_aws_ssm.cli._store.cache_clear()
+        self.addCleanup(python_aws_ssm.cli._store.cache_clear)
+
+    def test_cli_get(self) -> None:
+        self.parameter_store.get_parameter.return_value = "value-8"
+
+        result = self.runner.invoke(cli, ["get", "--key", "/my/test/8"])
+
+        self.assertEqual(0, result.exit_code)
+        self.assertEqual({"/my/test/8": "value-8"}, json.loads(result.output))
+        # A single key goes through GetParameter, not GetParameters.
+        self.parameter_store.get_parameter.assert_called_once_with("/my/test/8")
+        self.parameter_store.get_parameters.assert_not_called()
+
+    def test_cli_get_multiple_keys(self) -> None:
+        self.parameter_store.get_parameters.return_value = {
+            "/my/test/8": "value-8",
+            "/my/test/9": "value-9",
+        }
+
+        result = self.runner.invoke(
+            cli, ["get", "--key", "/my/test/8", "--key", "/my/test/9"]
+        )
+
+        self.assertEqual(0, result.exit_code)
+        self.assertEqual(
+            {"/my/test/8": "value-8", "/my/test/9": "value-9"},
+            json.loads(result.output),
+        )
+        self.parameter_store.get_parameters.assert_called_once_with(
+            ["/my/test/8", "/my/test/9"]
+        )
+
+    def test_cli_put_value(self) -> None:
+        result = self.runner.invoke(
+            cli, ["put", "--key", "/my/test/8", "--value", "value-8"]
+        )
+
+        self.assertEqual(0, result.exit_code)
+        self.parameter_store.client.put_parameter.assert_called_once_with(
+            Name="/my/test/8", Value="value-8", Type="String", Overwrite=True
+        )
+
+    def test_cli_put_file(self) -> None:
+        result = self.runner.invoke(
+            cli, ["put", "--key", "/my/test/8", "--file", FIXTURE_FILE]
+        )
+
+        self.assertEqual(0, result.exit_code)
+        self.parameter_store.client.put_parameter.assert_called_once_with(
+            Name="/my/test/8",
+            Value=Path(FIXTURE_FILE).read_text(),
+            Type="String",
+            Overwrite=True,
+        )
+
+    def test_cli_put_empty_file(self) -> None:
+        with tempfile.NamedTemporaryFile() as empty_file:
+            result = self.runner.invoke(
+                cli, ["put", "--key", "/my/test/8", "--file", empty_file.name]
+            )
+
+        self.assertEqual(0, result.exit_code)
+        self.parameter_store.client.put_parameter.assert_called_once_with(
+            Name="/my/test/8", Value="", Type="String", Overwrite=True
+        )
+
+    def test_cli_put_file_node(self) -> None:
+        result = self.runner.invoke(
+            cli,
+            [
+                "put",
+                "--key",
+                "/my/test/8",
+                "--file",
+                FIXTURE_FILE,
+                "--yaml-node",
+                "count-of-birds",
+                "--to-json",
+            ],
+        )
+
+        self.assertEqual(0, result.exit_code)
+        stored_value = self.parameter_store.client.put_parameter.call_args.kwargs[
+            "Value"
+        ]
+        self.assertEqual(
+            {"calling-birds": "four", "french-hens": "three"}, json.loads(stored_value)
+        )
+
+    def test_cli_put_file_node_without_json(self) -> None:
+        result = self.runner.invoke(
+            cli,
+            [
+                "put",
+                "--key",
+                "/my/test/8",
+                "--file",
+                FIXTURE_FILE,
+                "--yaml-node",
+                "golden-rings",
+            ],
+        )
+
+        self.assertEqual(0, result.exit_code)
+        self.parameter_store.client.put_parameter.assert_called_once_with(
+            Name="/my/test/8", Value="five", Type="String", Overwrite=True
+        )
+
+    def test_cli_put_to_json_skips_yaml_parse_for_json_input(self) -> None:
+        json_file = str(Path(FIXTURE_FILE).parent / "sample.json")
+
+        with patch("python_aws_ssm.cli.yaml_load") as yaml_load:
+            result = self.runner.invoke(
+                cli, ["put", "--key", "/my/test/8", "--file", json_file, "--to-json"]
+            )
+
+        self.assertEqual(0, result.exit_code)
+        yaml_load.assert_not_called()
+        stored_value = self.parameter_store.client.put_parameter.call_args.kwargs[
+            "Value"
+        ]
+        self.assertEqual({"golden-rings": "five"}, json.loads(stored_value))
+
+    def test_cli_put_to_json_falls_back_to_yaml_parse(self) -> None:
+        result = self.runner.invoke(
+            cli, ["put", "--key", "/my/test/8", "--file", FIXTURE_FILE, "--to-json"]
+        )
+
+        self.assertEqual(0, result.exit_code)
+        stored_value = self.parameter_store.client.put_parameter.call_args.kwargs[
+            "Value"
+        ]
+        self.assertEqual(
+            {
+                "count-of-birds": {"calling-birds": "four", "french-hens": "three"},
+                "golden-rings": "five",
+            },
+            json.loads(stored_value),
+        )
+
+    def test_cli_put_file_mapping_node_is_serialised_without_json_flag(self) -> None:
+        result = self.runner.invoke(
+            cli,
+            [
+                "put",
+                "--key",
+                "/my/test/8",
+                "--file",
+                FIXTURE_FILE,
+                "--yaml-node",
+                "count-of-birds",
+            ],
+        )
+
+        self.assertEqual(0, result.exit_code)
+        stored_value = self.parameter_store.client.put_parameter.call_args.kwargs[
+            "Value"
+        ]
+        self.assertEqual(
+            {"calling-birds": "four", "french-hens": "three"}, json.loads(stored_value)
+        )
+
+    def test_cli_put_to_json_sorts_keys(self) -> None:
+        unsorted_file = str(Path(FIXTURE_FILE).parent / "unsorted.yaml")
+
+        result = self.runner.invoke(
+            cli, ["put", "--key", "/my/test/8", "--file", unsorted_file, "--to-json"]
+        )
+
+        self.assertEqual(0, result.exit_code)
+        stored_value = self.parameter_store.client.put_parameter.call_args.kwargs[
+            "Value"
+        ]
+        self.assertEqual('{"apple":"two","zebra":"one"}', stored_value)
+
+    def test_cli_put_file_is_parsed_once_for_repeated_invocations(self) -> None:
+        with patch(
+            "python_aws_ssm.cli.yaml_load", wraps=python_aws_ssm.cli.yaml_load
+        ) as yaml_load:
+            for _ in range(2):
+                result = self.runner.invoke(
+                    cli,
+                    [
+                        "put",
+                        "--key",
+                        "/my/test/8",
+                        "--file",
+                        FIXTURE_FILE,
+                        "--yaml-node",
+                        "golden-rings",
+                    ],
+                )
+                self.assertEqual(0, result.exit_code)
+
+        yaml_load.assert_called_once()
+
+    def test_cli_put_requires_value_or_file(self) -> None:
+        result = self.runner.invoke(cli, ["put", "--key", "/my/test/8"])
+
+        self.assertNotEqual(0, result.exit_code)
+        self.parameter_store.client.put_parameter.assert_not_called()
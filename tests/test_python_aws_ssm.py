@@ -1,6 +1,9 @@
-from unittest import TestCase
-from unittest.mock import MagicMock
+from typing import Dict, Iterator
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+import python_aws_ssm.parameters
 from python_aws_ssm import __version__
 from python_aws_ssm.parameters import (
     InvalidParametersError,
@@ -13,223 +16,521 @@ def test_version() -> None:
     assert __version__ == "1.0.0"
 
 
-class TestGetParameters(TestCase):
-    def setUp(self) -> None:
-        self.parameter_store = ParameterStore(client=MagicMock())
+def test_get_parameter_returns_value(parameter_store: ParameterStore) -> None:
+    parameter_store.client.get_parameter.return_value = {
+        "Parameter": {"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}
+    }
 
-    def tearDown(self) -> None:
-        pass
+    value = parameter_store.get_parameter("foo_ssm_key_1")
 
-    def test_get_parameters_keys_are_mapped(self) -> None:
-        self.parameter_store.client.get_parameters.return_value = {
-            "Parameters": [
-                {"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"},
-                # Note: foo_ssm_key_2 does not exist so is not returned from SSM.
-                {"Name": "foo_ssm_key_3", "Value": "foo_ssm_value_3"},
-            ]
-        }
+    assert value == "foo_ssm_value_1"
+    parameter_store.client.get_parameter.assert_called_once_with(
+        Name="foo_ssm_key_1", WithDecryption=True
+    )
 
-        secrets = self.parameter_store.get_parameters(
-            ["foo_ssm_key_1", "foo_ssm_key_2", "foo_ssm_key_3"]
-        )
 
-        self.assertEqual(
-            {
-                "foo_ssm_key_1": "foo_ssm_value_1",
-                "foo_ssm_key_2": None,
-                "foo_ssm_key_3": "foo_ssm_value_3",
-            },
-            secrets,
-        )
+def test_get_parameter_results_are_cached(parameter_store: ParameterStore) -> None:
+    parameter_store.client.get_parameter.return_value = {
+        "Parameter": {"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}
+    }
 
-        self.parameter_store.client.get_parameters.assert_called_once_with(
-            Names=["foo_ssm_key_1", "foo_ssm_key_2", "foo_ssm_key_3"],
-            WithDecryption=True,
-        )
+    first = parameter_store.get_parameter("foo_ssm_key_1")
+    second = parameter_store.get_parameter("foo_ssm_key_1")
+
+    assert first == second
+    parameter_store.client.get_parameter.assert_called_once()
+
+
+def test_get_parameters_keys_are_mapped(parameter_store: ParameterStore) -> None:
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [
+            {"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"},
+            # Note: foo_ssm_key_2 does not exist so is not returned from SSM.
+            {"Name": "foo_ssm_key_3", "Value": "foo_ssm_value_3"},
+        ]
+    }
+
+    secrets = parameter_store.get_parameters(
+        ["foo_ssm_key_1", "foo_ssm_key_2", "foo_ssm_key_3"]
+    )
+
+    assert secrets == {
+        "foo_ssm_key_1": "foo_ssm_value_1",
+        "foo_ssm_key_2": None,
+        "foo_ssm_key_3": "foo_ssm_value_3",
+    }
+
+    parameter_store.client.get_parameters.assert_called_once_with(
+        Names=["foo_ssm_key_1", "foo_ssm_key_2", "foo_ssm_key_3"],
+        WithDecryption=True,
+    )
+
+
+def test_get_parameters_unknown_keys_are_ignored(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [
+            {"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"},
+            {"Name": "some_other_key", "Value": "value"},
+        ]
+    }
+
+    secrets = parameter_store.get_parameters(["foo_ssm_key_1"])
+
+    assert secrets == {"foo_ssm_key_1": "foo_ssm_value_1"}
+
+
+def test_get_parameters_batches_requests_in_chunks_of_ten(
+    parameter_store: ParameterStore,
+) -> None:
+    ssm_key_names = [f"foo_ssm_key_{index}" for index in range(25)]
+    parameter_store.client.get_parameters.side_effect = lambda **kwargs: {
+        "Parameters": [
+            {"Name": name, "Value": f"value_{name}"} for name in kwargs["Names"]
+        ]
+    }
+
+    secrets = parameter_store.get_parameters(ssm_key_names)
+
+    assert secrets == {name: f"value_{name}" for name in ssm_key_names}
+    assert parameter_store.client.get_parameters.call_count == 3
+    requested_names = [
+        name
+        for call in parameter_store.client.get_parameters.call_args_list
+        for name in call.kwargs["Names"]
+    ]
+    assert sorted(requested_names) == sorted(ssm_key_names)
+
+
+def test_get_parameters_without_decryption(parameter_store: ParameterStore) -> None:
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [{"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}]
+    }
+
+    parameter_store.get_parameters(["foo_ssm_key_1"], with_decryption=False)
+
+    parameter_store.client.get_parameters.assert_called_once_with(
+        Names=["foo_ssm_key_1"], WithDecryption=False
+    )
+
+
+def test_get_parameters_by_path_without_decryption(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {"Parameters": []}
+    ]
+
+    parameter_store.get_parameters_by_path("/bar/env/", with_decryption=False)
+
+    parameter_store.client.get_paginator.return_value.paginate.assert_called_once_with(
+        Path="/bar/env/",
+        Recursive=False,
+        WithDecryption=False,
+        PaginationConfig={"PageSize": 10},
+    )
+
+
+def test_get_parameters_results_are_cached(parameter_store: ParameterStore) -> None:
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [{"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}]
+    }
+
+    first = parameter_store.get_parameters(["foo_ssm_key_1"])
+    second = parameter_store.get_parameters(["foo_ssm_key_1"])
+
+    assert first == second
+    parameter_store.client.get_parameters.assert_called_once()
+
+
+def test_get_parameters_results_are_read_only(parameter_store: ParameterStore) -> None:
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [{"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}]
+    }
+
+    secrets = parameter_store.get_parameters(["foo_ssm_key_1"])
+
+    with pytest.raises(TypeError):
+        secrets["foo_ssm_key_1"] = "mutated"  # type: ignore[index]
+
+
+def test_get_parameters_cache_expires_after_ttl(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [{"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}]
+    }
+
+    with patch("python_aws_ssm.parameters.time.monotonic", side_effect=[0.0, 31.0]):
+        parameter_store.get_parameters(["foo_ssm_key_1"])
+        parameter_store.get_parameters(["foo_ssm_key_1"])
+
+    assert parameter_store.client.get_parameters.call_count == 2
+
+
+def test_get_parameters_caching_can_be_disabled() -> None:
+    parameter_store = ParameterStore(client=MagicMock(), ssm_cache_ttl=0)
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [{"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"}]
+    }
+
+    parameter_store.get_parameters(["foo_ssm_key_1"])
+    parameter_store.get_parameters(["foo_ssm_key_1"])
+
+    assert parameter_store.client.get_parameters.call_count == 2
 
-    def test_get_parameters_unknown_keys_are_ignored(self) -> None:
-        self.parameter_store.client.get_parameters.return_value = {
-            "Parameters": [
-                {"Name": "foo_ssm_key_1", "Value": "foo_ssm_value_1"},
-                {"Name": "some_other_key", "Value": "value"},
-            ]
-        }
 
-        secrets = self.parameter_store.get_parameters(["foo_ssm_key_1"])
+def test_get_parameters_by_path_results_are_cached(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {"Parameters": [{"Name": "/bar/env/foo_ssm_key_1", "Value": "value_1"}]}
+    ]
 
-        self.assertEqual({"foo_ssm_key_1": "foo_ssm_value_1"}, secrets)
+    first = parameter_store.get_parameters_by_path("/bar/env/")
+    second = parameter_store.get_parameters_by_path("/bar/env/")
 
-    def test_get_parameters_aws_errors_are_not_caught(self) -> None:
-        expected_error = Exception("Unexpected AWS error!")
-        self.parameter_store.client.get_parameters.side_effect = expected_error
+    assert first == second
+    parameter_store.client.get_paginator.return_value.paginate.assert_called_once()
 
-        with self.assertRaises(Exception, msg="Unexpected AWS error!"):
-            self.parameter_store.get_parameters(["/key"])
-            return None
 
-    def test_get_parameters_by_path_keys_are_mapped(self) -> None:
-        self.parameter_store.client.get_parameters_by_path.return_value = {
+def test_default_client_is_shared_between_instances() -> None:
+    python_aws_ssm.parameters._DEFAULT_CLIENT = None
+    try:
+        with patch("boto3.client") as boto_client:
+            first = ParameterStore()
+            second = ParameterStore()
+
+        assert first.client is second.client
+        boto_client.assert_called_once()
+    finally:
+        python_aws_ssm.parameters._DEFAULT_CLIENT = None
+
+
+def test_get_parameters_aws_errors_are_not_caught(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_parameters.side_effect = Exception(
+        "Unexpected AWS error!"
+    )
+
+    with pytest.raises(Exception, match="Unexpected AWS error!"):
+        parameter_store.get_parameters(["/key"])
+
+
+def test_get_parameters_by_path_keys_are_mapped(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
             "Parameters": [
                 {"Name": "/bar/env/foo_ssm_key_1", "Value": "foo_ssm_value_1"},
                 {"Name": "/bar/env/foo_ssm_key_2", "Value": "foo_ssm_value_2"},
             ]
         }
-        secrets = self.parameter_store.get_parameters_by_path("/bar/env/")
-
-        self.assertEqual(
-            {"foo_ssm_key_1": "foo_ssm_value_1", "foo_ssm_key_2": "foo_ssm_value_2"},
-            secrets,
-        )
-
-        self.parameter_store.client.get_parameters_by_path.assert_called_once_with(
-            Path="/bar/env/", Recursive=False, WithDecryption=True
-        )
-
-    def test_get_parameters_by_path_are_stripped_of_leading_slashes(self) -> None:
-        """
-        Leading slashes of parameters are stripped consistently.
-
-        When requesting parameters by a path that is not recursive and nested,
-        the leading slashes should be consistently stripped. In versions <= 0.1.2,
-        the leading slashes were not included if the parameter path ended in a
-        trailing slash, but not if the parameter path ended without a trailing
-        slash…
-        """
-        self.parameter_store.client.get_parameters_by_path.return_value = {
+    ]
+    secrets = parameter_store.get_parameters_by_path("/bar/env/")
+
+    assert secrets == {
+        "foo_ssm_key_1": "foo_ssm_value_1",
+        "foo_ssm_key_2": "foo_ssm_value_2",
+    }
+
+    parameter_store.client.get_paginator.assert_called_once_with(
+        "get_parameters_by_path"
+    )
+    parameter_store.client.get_paginator.return_value.paginate.assert_called_once_with(
+        Path="/bar/env/",
+        Recursive=False,
+        WithDecryption=True,
+        PaginationConfig={"PageSize": 10},
+    )
+
+
+def test_get_parameters_by_path_merges_all_pages(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {"Parameters": [{"Name": "/bar/env/foo_ssm_key_1", "Value": "value_1"}]},
+        {"Parameters": [{"Name": "/bar/env/foo_ssm_key_2", "Value": "value_2"}]},
+    ]
+
+    secrets = parameter_store.get_parameters_by_path("/bar/env/")
+
+    assert secrets == {"foo_ssm_key_1": "value_1", "foo_ssm_key_2": "value_2"}
+
+
+def test_get_parameters_by_path_are_stripped_of_leading_slashes(
+    parameter_store: ParameterStore,
+) -> None:
+    """
+    Leading slashes of parameters are stripped consistently.
+
+    When requesting parameters by a path that is not recursive and nested,
+    the leading slashes should be consistently stripped. In versions <= 0.1.2,
+    the leading slashes were not included if the parameter path ended in a
+    trailing slash, but not if the parameter path ended without a trailing
+    slash…
+    """
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
             "Parameters": [
                 {"Name": "/bar/env/foo_ssm_key_1", "Value": "foo_ssm_value_1"},
                 {"Name": "/bar/env/foo_ssm_key_2", "Value": "foo_ssm_value_2"},
             ]
         }
-        # Note that the requested path has no trailing slash.
-        parameters_path = "/bar/env"
-        secrets = self.parameter_store.get_parameters_by_path(parameters_path)
-
-        self.assertEqual(
-            {"foo_ssm_key_1": "foo_ssm_value_1", "foo_ssm_key_2": "foo_ssm_value_2"},
-            secrets,
-        )
-
-        self.parameter_store.client.get_parameters_by_path.assert_called_once_with(
-            Path=parameters_path, Recursive=False, WithDecryption=True
-        )
-
-    def test_get_parameters_by_path_recursive_not_nested(self) -> None:
-        self.parameter_store.client.get_parameters_by_path.return_value = {
+    ]
+    # Note that the requested path has no trailing slash.
+    parameters_path = "/bar/env"
+    secrets = parameter_store.get_parameters_by_path(parameters_path)
+
+    assert secrets == {
+        "foo_ssm_key_1": "foo_ssm_value_1",
+        "foo_ssm_key_2": "foo_ssm_value_2",
+    }
+
+    parameter_store.client.get_paginator.assert_called_once_with(
+        "get_parameters_by_path"
+    )
+    parameter_store.client.get_paginator.return_value.paginate.assert_called_once_with(
+        Path=parameters_path,
+        Recursive=False,
+        WithDecryption=True,
+        PaginationConfig={"PageSize": 10},
+    )
+
+
+def test_get_parameters_by_path_recursive_not_nested(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
             "Parameters": [
                 {"Name": "/bar/env/foo_ssm_key_1", "Value": "foo_ssm_value_1"},
                 {"Name": "/bar/env/foo_ssm_key_2", "Value": "foo_ssm_value_2"},
             ]
         }
-        secrets = self.parameter_store.get_parameters_by_path(
-            "/bar/", recursive=True, nested=False
-        )
-
-        self.assertEqual(
-            {
-                "env/foo_ssm_key_1": "foo_ssm_value_1",
-                "env/foo_ssm_key_2": "foo_ssm_value_2",
-            },
-            secrets,
-        )
-
-        self.parameter_store.client.get_parameters_by_path.assert_called_once_with(
-            Path="/bar/", Recursive=True, WithDecryption=True
-        )
-
-    def test_get_parameters_by_path_recursive_nested(self) -> None:
-        self.parameter_store.client.get_parameters_by_path.return_value = {
+    ]
+    secrets = parameter_store.get_parameters_by_path(
+        "/bar/", recursive=True, nested=False
+    )
+
+    assert secrets == {
+        "env/foo_ssm_key_1": "foo_ssm_value_1",
+        "env/foo_ssm_key_2": "foo_ssm_value_2",
+    }
+
+    parameter_store.client.get_paginator.assert_called_once_with(
+        "get_parameters_by_path"
+    )
+    parameter_store.client.get_paginator.return_value.paginate.assert_called_once_with(
+        Path="/bar/",
+        Recursive=True,
+        WithDecryption=True,
+        PaginationConfig={"PageSize": 10},
+    )
+
+
+def test_get_parameters_by_path_recursive_nested(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
             "Parameters": [
                 {"Name": "/bar/env/foo_ssm_key_1", "Value": "foo_ssm_value_1"},
                 {"Name": "/bar/env/foo_ssm_key_2", "Value": "foo_ssm_value_2"},
             ]
         }
-        secrets = self.parameter_store.get_parameters_by_path(
-            "/bar/", recursive=True, nested=True
-        )
-
-        self.assertEqual(
-            {
-                "env": {
-                    "foo_ssm_key_1": "foo_ssm_value_1",
-                    "foo_ssm_key_2": "foo_ssm_value_2",
+    ]
+    secrets = parameter_store.get_parameters_by_path(
+        "/bar/", recursive=True, nested=True
+    )
+
+    assert secrets == {
+        "env": {
+            "foo_ssm_key_1": "foo_ssm_value_1",
+            "foo_ssm_key_2": "foo_ssm_value_2",
+        }
+    }
+
+    parameter_store.client.get_paginator.assert_called_once_with(
+        "get_parameters_by_path"
+    )
+    parameter_store.client.get_paginator.return_value.paginate.assert_called_once_with(
+        Path="/bar/",
+        Recursive=True,
+        WithDecryption=True,
+        PaginationConfig={"PageSize": 10},
+    )
+
+
+def test_get_parameters_by_path_recursive_nested_deep_hierarchy(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Parameters": [
+                {"Name": "/app/env/region/service/feature/flag", "Value": "on"},
+                {"Name": "/app/env/region/service/feature/other", "Value": "off"},
+                {"Name": "/app/env/region/service/name", "Value": "foo"},
+            ]
+        }
+    ]
+
+    secrets = parameter_store.get_parameters_by_path(
+        "/app/", recursive=True, nested=True
+    )
+
+    assert secrets == {
+        "env": {
+            "region": {
+                "service": {
+                    "feature": {"flag": "on", "other": "off"},
+                    "name": "foo",
                 }
-            },
-            secrets,
-        )
+            }
+        }
+    }
+
+
+def test_get_parameters_by_path_nested_leaf_and_branch_under_same_name(
+    parameter_store: ParameterStore,
+) -> None:
+    """
+    SSM allows a name to hold both a value and a subtree; the subtree
+    replaces the value when nesting instead of raising.
+    """
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Parameters": [
+                {"Name": "/bar/a", "Value": "leaf"},
+                {"Name": "/bar/a/b", "Value": "branch"},
+            ]
+        }
+    ]
+
+    secrets = parameter_store.get_parameters_by_path(
+        "/bar/", recursive=True, nested=True
+    )
+
+    assert secrets == {"a": {"b": "branch"}}
 
-        self.parameter_store.client.get_parameters_by_path.assert_called_once_with(
-            Path="/bar/", Recursive=True, WithDecryption=True
-        )
 
-    def test_get_parameter_by_path_aws_errors_are_not_caught(self) -> None:
-        expected_error = Exception("Unexpected AWS error!")
-        self.parameter_store.client.get_parameters_by_path.side_effect = expected_error
+def test_get_parameter_by_path_aws_errors_are_not_caught(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.side_effect = Exception(
+        "Unexpected AWS error!"
+    )
 
-        with self.assertRaises(Exception, msg="Unexpected AWS error!"):
-            self.parameter_store.get_parameters_by_path("/key")
+    with pytest.raises(Exception, match="Unexpected AWS error!"):
+        parameter_store.get_parameters_by_path("/key")
 
-    def test_get_required_parameters_by_path_can_be_asserted(self) -> None:
-        """
-        Required parameters that are missing from a path result in an error.
-        """
 
-        self.parameter_store.client.get_parameters_by_path.return_value = {
+def test_get_required_parameters_by_path_can_be_asserted(
+    parameter_store: ParameterStore,
+) -> None:
+    """
+    Required parameters that are missing from a path result in an error.
+    """
+
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
             "Parameters": [
                 # Only one of the required parameters is returned.
                 {"Name": "/path/sub/key", "Value": "foo_ssm_value_1"},
                 {"Name": "/path/sub/key2", "Value": "foo_ssm_value_2"},
             ]
         }
+    ]
+
+    expected_msg = "Missing parameters [baz, foo/bar] on path /path/sub/"
+    with pytest.raises(MissingParameterError) as exc_info:
+        parameter_store.get_parameters_by_path(
+            "/path/sub/", required_parameters={"baz", "foo/bar", "key"}
+        )
+    assert str(exc_info.value) == expected_msg
+    assert exc_info.value.parameter_path == "/path/sub/"
+    assert len(exc_info.value.parameter_names) == 2
+    assert sorted(exc_info.value.parameter_names) == sorted(["baz", "foo/bar"])
 
-        expected_msg = "Missing parameters [baz, foo/bar] on path /path/sub/"
-        with self.assertRaises(MissingParameterError, msg=expected_msg) as exc_info:
-            self.parameter_store.get_parameters_by_path(
-                "/path/sub/", required_parameters={"baz", "foo/bar", "key"}
-            )
-        assert exc_info.exception.parameter_path == "/path/sub/"
-        assert len(exc_info.exception.parameter_names) == 2
-        assert sorted(exc_info.exception.parameter_names) == sorted(["baz", "foo/bar"])
-
-    def test_required_parameters_by_path_are_checked_before_recursive_nested(
-        self,
-    ) -> None:
-        self.parameter_store.client.get_parameters_by_path.return_value = {
+
+def test_required_parameters_by_path_are_checked_before_recursive_nested(
+    parameter_store: ParameterStore,
+) -> None:
+    parameter_store.client.get_paginator.return_value.paginate.return_value = [
+        {
             "Parameters": [
                 {"Name": "/bar/env/foo_ssm_key_1", "Value": "foo_ssm_value_1"},
                 {"Name": "/bar/env/foo_ssm_key_2", "Value": "foo_ssm_value_2"},
             ]
         }
-        secrets = self.parameter_store.get_parameters_by_path(
-            "/bar/",
-            recursive=True,
-            nested=True,
-            required_parameters={"env/foo_ssm_key_1", "env/foo_ssm_key_2"},
-        )
-
-        self.assertEqual(
-            {
-                "env": {
-                    "foo_ssm_key_1": "foo_ssm_value_1",
-                    "foo_ssm_key_2": "foo_ssm_value_2",
-                }
-            },
-            secrets,
-        )
-
-        self.parameter_store.client.get_parameters_by_path.assert_called_once_with(
-            Path="/bar/", Recursive=True, WithDecryption=True
-        )
-
-    def test_requesting_invalid_parameters(self) -> None:
-        """Assert requesting invalid parameters results in an exception."""
-        self.parameter_store.client.get_parameters.return_value = {
-            "Parameters": [{"Name": "/test/foo", "Value": "foo_ssm_value_1"}],
-            "InvalidParameters": ["/test/bar"],
+    ]
+    secrets = parameter_store.get_parameters_by_path(
+        "/bar/",
+        recursive=True,
+        nested=True,
+        required_parameters={"env/foo_ssm_key_1", "env/foo_ssm_key_2"},
+    )
+
+    assert secrets == {
+        "env": {
+            "foo_ssm_key_1": "foo_ssm_value_1",
+            "foo_ssm_key_2": "foo_ssm_value_2",
         }
-
-        with self.assertRaises(
-            InvalidParametersError, msg='Invalid parameters ["/test/bar"] requested'
-        ) as exc_info:
-            self.parameter_store.get_parameters(["/test/foo", "/test/bar"])
-        assert exc_info.exception.invalid_parameters == ["/test/bar"]
+    }
+
+    parameter_store.client.get_paginator.assert_called_once_with(
+        "get_parameters_by_path"
+    )
+    parameter_store.client.get_paginator.return_value.paginate.assert_called_once_with(
+        Path="/bar/",
+        Recursive=True,
+        WithDecryption=True,
+        PaginationConfig={"PageSize": 10},
+    )
+
+
+def test_only_required_parameters_stop_pagination_early(
+    parameter_store: ParameterStore,
+) -> None:
+    pages = [
+        {"Parameters": [{"Name": "/bar/env/foo_ssm_key_1", "Value": "value_1"}]},
+        {"Parameters": [{"Name": "/bar/env/foo_ssm_key_2", "Value": "value_2"}]},
+        {"Parameters": [{"Name": "/bar/env/foo_ssm_key_3", "Value": "value_3"}]},
+    ]
+    served_pages = []
+
+    def serve_pages() -> Iterator[Dict]:
+        for page in pages:
+            served_pages.append(page)
+            yield page
+
+    parameter_store.client.get_paginator.return_value.paginate.return_value = (
+        serve_pages()
+    )
+
+    secrets = parameter_store.get_parameters_by_path(
+        "/bar/",
+        recursive=True,
+        required_parameters={"env/foo_ssm_key_1"},
+        only_required=True,
+    )
+
+    assert secrets == {"env/foo_ssm_key_1": "value_1"}
+    # The required set is satisfied by the first page; at most one
+    # further page is requested by the read-ahead before breaking.
+    assert len(served_pages) < 3
+
+
+def test_requesting_invalid_parameters(parameter_store: ParameterStore) -> None:
+    """Assert requesting invalid parameters results in an exception."""
+    parameter_store.client.get_parameters.return_value = {
+        "Parameters": [{"Name": "/test/foo", "Value": "foo_ssm_value_1"}],
+        "InvalidParameters": ["/test/bar"],
+    }
+
+    with pytest.raises(InvalidParametersError) as exc_info:
+        parameter_store.get_parameters(["/test/foo", "/test/bar"])
+    assert exc_info.value.invalid_parameters == ["/test/bar"]